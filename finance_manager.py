@@ -1,33 +1,127 @@
 import sqlite3
 import hashlib
+import hmac
 import datetime
 import getpass
 import json
 import os
-from typing import List, Dict, Tuple, Optional
+import collections
+from typing import List, Dict, Tuple, Optional, Iterator
+
+try:
+    import orjson  # optional: much faster JSON encoding for backups
+except ImportError:
+    orjson = None
+
+# SQL kept in one place; dynamic variants are memoized below to skip rebuilding the text
+_SQL_INSERT_USER = "INSERT INTO users (username, password, salt) VALUES (?, ?, ?)"
+_SQL_SELECT_USER_LOGIN = "SELECT id, password, salt FROM users WHERE username = ?"
+_SQL_UPDATE_USER_PASSWORD = "UPDATE users SET password = ?, salt = ? WHERE id = ?"
+
+_SQL_INSERT_TX = "INSERT INTO transactions (user_id, type, amount, category, description, date) VALUES (?, ?, ?, ?, ?, ?)"
+_SQL_DELETE_TX = "DELETE FROM transactions WHERE id = ? AND user_id = ?"
+_SQL_SELECT_TX_BY_USER = "SELECT id, type, amount, category, description, date FROM transactions WHERE user_id = ?"
+_SQL_DELETE_TX_BY_USER = "DELETE FROM transactions WHERE user_id = ?"
+_SQL_REPORT_TOTALS = "SELECT type, SUM(amount) FROM transactions WHERE user_id = ? AND date >= ? AND date < ? GROUP BY type"
+_SQL_REPORT_CATEGORIES = "SELECT category, SUM(amount) FROM transactions WHERE user_id = ? AND date >= ? AND date < ? AND type = 'expense' GROUP BY category"
+
+_SQL_UPSERT_BUDGET = "INSERT OR REPLACE INTO budgets (user_id, category, amount, month, year) VALUES (?, ?, ?, ?, ?)"
+_SQL_INSERT_BUDGET = "INSERT INTO budgets (user_id, category, amount, month, year) VALUES (?, ?, ?, ?, ?)"
+_SQL_SELECT_BUDGET_STATUS = (
+    "SELECT b.amount, "
+    "(SELECT COALESCE(SUM(amount), 0) FROM transactions WHERE user_id = ? AND category = ? AND type = 'expense' AND date >= ?) "
+    "FROM budgets b WHERE b.user_id = ? AND b.category = ? AND b.month = ? AND b.year = ?"
+)
+_SQL_SELECT_BUDGETS = "SELECT category, amount FROM budgets WHERE user_id = ? AND month = ? AND year = ?"
+_SQL_DELETE_BUDGETS_BY_USER = "DELETE FROM budgets WHERE user_id = ?"
+
+# PBKDF2-HMAC-SHA256 parameters for stored passwords
+_PBKDF2_ITERATIONS = 200_000
+_SALT_BYTES = 16
+
+_TRANSACTION_TYPES = frozenset(('income', 'expense'))
+
+# Row type returned by get_transactions; fields follow the SELECT column order
+Transaction = collections.namedtuple("Transaction", "id type amount category description date")
+
+# Display formats; stored timestamps use _timestamp() and never hit strftime
+_FMT_MONTH_YEAR = "%B %Y"
+_FMT_BACKUP_STAMP = "%Y%m%d_%H%M%S"
+
+# Filter clauses for get_transactions, in the order their parameters are bound
+_TX_FILTERS = (" AND date >= ?", " AND date <= ?", " AND category = ?", " AND type = ?")
+_tx_query_cache: Dict[Tuple[bool, bool, bool, bool, bool], str] = {}
+
+# Per-connection prepared-statement cache size. The default 128 already fits
+# every statement used here; this is headroom for new queries.
+_STATEMENT_CACHE_SIZE = 256
+
+# Default number of transactions returned per get_transactions() page
+_TX_PAGE_SIZE = 200
+
+# Rows pulled from SQLite per fetchmany() call when streaming transactions
+_TX_FETCH_SIZE = 256
+
+# Updatable columns for update_transaction, in the order their parameters are bound
+_TX_UPDATE_FIELDS = ("amount", "category", "description")
+_tx_update_cache: Dict[frozenset, str] = {}
+
+def _timestamp(now: datetime.datetime) -> str:
+    """Format a datetime as the 'YYYY-MM-DD HH:MM:SS' text stored in the database"""
+    return now.isoformat(sep=' ', timespec='seconds')
+
+def _transactions_query(has_start: bool, has_end: bool, has_category: bool, has_type: bool, has_limit: bool = False) -> str:
+    """Return the cached SELECT for the given combination of filters"""
+    key = (has_start, has_end, has_category, has_type, has_limit)
+    query = _tx_query_cache.get(key)
+    if query is None:
+        query = _SQL_SELECT_TX_BY_USER
+        query += "".join(clause for clause, used in zip(_TX_FILTERS, key) if used)
+        # id breaks date ties so pages stay stable; ascending id keeps the index order
+        query += " ORDER BY date DESC, id"
+        if has_limit:
+            query += " LIMIT ? OFFSET ?"
+        _tx_query_cache[key] = query
+    return query
+
+def _update_transaction_query(fields: frozenset) -> str:
+    """Return the cached UPDATE for the given set of columns"""
+    query = _tx_update_cache.get(fields)
+    if query is None:
+        assignments = ", ".join(f"{field} = ?" for field in _TX_UPDATE_FIELDS if field in fields)
+        query = f"UPDATE transactions SET {assignments} WHERE id = ? AND user_id = ?"
+        _tx_update_cache[fields] = query
+    return query
 
 class PersonalFinanceManager:
     def __init__(self, db_name: str = "finance.db"):
         self.db_name = db_name
         self.current_user = None
+        self.conn = sqlite3.connect(self.db_name, check_same_thread=False, isolation_level=None,
+                                    cached_statements=_STATEMENT_CACHE_SIZE)
+        self.cursor = self.conn.cursor()
         self.setup_database()
         
+    def close(self):
+        """Close the database connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+            self.cursor = None
+        
     def setup_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        # Users table
-        cursor.execute('''
+        # Tables, indexes and connection PRAGMAs in a single script
+        self.conn.executescript('''
+            -- Users table
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL
-            )
-        ''')
-        
-        # Transactions table
-        cursor.execute('''
+                password TEXT NOT NULL,
+                salt TEXT
+            );
+            
+            -- Transactions table
             CREATE TABLE IF NOT EXISTS transactions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER NOT NULL,
@@ -37,11 +131,9 @@ class PersonalFinanceManager:
                 description TEXT,
                 date TEXT NOT NULL,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Budgets table
-        cursor.execute('''
+            );
+            
+            -- Budgets table
             CREATE TABLE IF NOT EXISTS budgets (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER NOT NULL,
@@ -51,15 +143,49 @@ class PersonalFinanceManager:
                 year INTEGER NOT NULL,
                 FOREIGN KEY (user_id) REFERENCES users (id),
                 UNIQUE(user_id, category, month, year)
-            )
+            );
+            
+            -- Indexes for the per-user lookups used by reports and budgets
+            CREATE INDEX IF NOT EXISTS idx_tx_user_date ON transactions(user_id, date DESC);
+            -- (user_id, category, type, date) serves the month-to-date spend in check_budget;
+            -- it supersedes the earlier idx_tx_user_cat_type
+            DROP INDEX IF EXISTS idx_tx_user_cat_type;
+            CREATE INDEX IF NOT EXISTS idx_tx_user_cat_type_date ON transactions(user_id, category, type, date);
+            CREATE INDEX IF NOT EXISTS idx_budgets_user_my ON budgets(user_id, month, year);
+            
+            -- Connection tuning: WAL journal, fewer fsyncs, larger page cache
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
         ''')
         
-        conn.commit()
-        conn.close()
+        # Databases created before salted hashing lack the salt column
+        self.cursor.execute("PRAGMA table_info(users)")
+        if 'salt' not in [column[1] for column in self.cursor.fetchall()]:
+            self.cursor.execute("ALTER TABLE users ADD COLUMN salt TEXT")
     
-    def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def hash_password(self, password: str, salt: bytes) -> str:
+        """Hash password using salted PBKDF2-HMAC-SHA256"""
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, _PBKDF2_ITERATIONS).hex()
+    
+    def _verify_password(self, user_id: int, password: str, stored_hash: str, salt: Optional[str]) -> bool:
+        """Check a password against its stored hash, upgrading legacy SHA-256 hashes"""
+        if salt is not None:
+            return hmac.compare_digest(self.hash_password(password, bytes.fromhex(salt)), stored_hash)
+            
+        # Accounts registered before salting store a bare SHA-256 digest
+        if not hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored_hash):
+            return False
+            
+        new_salt = os.urandom(_SALT_BYTES)
+        with self.conn:
+            self.cursor.execute(
+                _SQL_UPDATE_USER_PASSWORD,
+                (self.hash_password(password, new_salt), new_salt.hex(), user_id)
+            )
+        return True
     
     def register_user(self, username: str, password: str) -> bool:
         """Register a new user"""
@@ -67,38 +193,24 @@ class PersonalFinanceManager:
             print("Username and password cannot be empty.")
             return False
             
-        hashed_password = self.hash_password(password)
+        salt = os.urandom(_SALT_BYTES)
+        hashed_password = self.hash_password(password, salt)
         
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO users (username, password) VALUES (?, ?)",
-                (username, hashed_password)
-            )
-            conn.commit()
+            with self.conn:
+                self.cursor.execute(_SQL_INSERT_USER, (username, hashed_password, salt.hex()))
             print("Registration successful!")
             return True
         except sqlite3.IntegrityError:
             print("Username already exists. Please choose a different one.")
             return False
-        finally:
-            conn.close()
     
     def login(self, username: str, password: str) -> bool:
         """Authenticate user"""
-        hashed_password = self.hash_password(password)
-        
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id FROM users WHERE username = ? AND password = ?",
-            (username, hashed_password)
-        )
-        user = cursor.fetchone()
-        conn.close()
+        self.cursor.execute(_SQL_SELECT_USER_LOGIN, (username,))
+        user = self.cursor.fetchone()
         
-        if user:
+        if user and self._verify_password(user[0], password, user[1], user[2]):
             self.current_user = user[0]
             print(f"Welcome, {username}!")
             return True
@@ -112,7 +224,7 @@ class PersonalFinanceManager:
             print("Please log in first.")
             return False
             
-        if transaction_type not in ['income', 'expense']:
+        if transaction_type not in _TRANSACTION_TYPES:
             print("Transaction type must be 'income' or 'expense'.")
             return False
             
@@ -120,16 +232,14 @@ class PersonalFinanceManager:
             print("Amount must be positive.")
             return False
             
-        date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        date = _timestamp(datetime.datetime.now())
         
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO transactions (user_id, type, amount, category, description, date) VALUES (?, ?, ?, ?, ?, ?)",
-                (self.current_user, transaction_type, amount, category, description, date)
-            )
-            conn.commit()
+            with self.conn:
+                self.cursor.execute(
+                    _SQL_INSERT_TX,
+                    (self.current_user, transaction_type, amount, category, description, date)
+                )
             print("Transaction added successfully!")
             
             # Check if budget is exceeded
@@ -139,8 +249,6 @@ class PersonalFinanceManager:
         except Exception as e:
             print(f"Error adding transaction: {e}")
             return False
-        finally:
-            conn.close()
     
     def update_transaction(self, transaction_id: int, amount: float = None, category: str = None, description: str = None) -> bool:
         """Update an existing transaction"""
@@ -148,7 +256,7 @@ class PersonalFinanceManager:
             print("Please log in first.")
             return False
             
-        # Build the update query dynamically based on provided parameters
+        # Collect the provided columns; the matching query is cached per column set
         updates = []
         params = []
         
@@ -156,15 +264,15 @@ class PersonalFinanceManager:
             if amount <= 0:
                 print("Amount must be positive.")
                 return False
-            updates.append("amount = ?")
+            updates.append("amount")
             params.append(amount)
             
         if category is not None:
-            updates.append("category = ?")
+            updates.append("category")
             params.append(category)
             
         if description is not None:
-            updates.append("description = ?")
+            updates.append("description")
             params.append(description)
             
         if not updates:
@@ -175,25 +283,18 @@ class PersonalFinanceManager:
         params.append(self.current_user)
         
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                f"UPDATE transactions SET {', '.join(updates)} WHERE id = ? AND user_id = ?",
-                params
-            )
+            with self.conn:
+                self.cursor.execute(_update_transaction_query(frozenset(updates)), params)
             
-            if cursor.rowcount == 0:
+            if self.cursor.rowcount == 0:
                 print("Transaction not found or you don't have permission to update it.")
                 return False
                 
-            conn.commit()
             print("Transaction updated successfully!")
             return True
         except Exception as e:
             print(f"Error updating transaction: {e}")
             return False
-        finally:
-            conn.close()
     
     def delete_transaction(self, transaction_id: int) -> bool:
         """Delete a transaction"""
@@ -202,76 +303,65 @@ class PersonalFinanceManager:
             return False
             
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM transactions WHERE id = ? AND user_id = ?",
-                (transaction_id, self.current_user)
-            )
+            with self.conn:
+                self.cursor.execute(_SQL_DELETE_TX, (transaction_id, self.current_user))
             
-            if cursor.rowcount == 0:
+            if self.cursor.rowcount == 0:
                 print("Transaction not found or you don't have permission to delete it.")
                 return False
                 
-            conn.commit()
             print("Transaction deleted successfully!")
             return True
         except Exception as e:
             print(f"Error deleting transaction: {e}")
             return False
-        finally:
-            conn.close()
     
-    def get_transactions(self, start_date: str = None, end_date: str = None, category: str = None, transaction_type: str = None) -> List[Dict]:
-        """Retrieve transactions with optional filters"""
-        if not self.current_user:
-            print("Please log in first.")
-            return []
-            
-        query = "SELECT id, type, amount, category, description, date FROM transactions WHERE user_id = ?"
+    def _iter_transactions(self, start_date: str = None, end_date: str = None, category: str = None, transaction_type: str = None,
+                           limit: Optional[int] = None, offset: int = 0) -> Iterator[Tuple]:
+        """Stream (id, type, amount, category, description, date) rows in batches"""
+        query = _transactions_query(bool(start_date), bool(end_date), bool(category), bool(transaction_type), limit is not None)
         params = [self.current_user]
         
         if start_date:
-            query += " AND date >= ?"
             params.append(start_date)
             
         if end_date:
-            query += " AND date <= ?"
             params.append(end_date)
             
         if category:
-            query += " AND category = ?"
             params.append(category)
             
         if transaction_type:
-            query += " AND type = ?"
             params.append(transaction_type)
             
-        query += " ORDER BY date DESC"
-        
+        if limit is not None:
+            params.append(limit)
+            params.append(offset)
+            
+        # Own cursor so callers can run other queries while iterating
+        cursor = self.conn.execute(query, params)
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            transactions = cursor.fetchall()
+            while True:
+                rows = cursor.fetchmany(_TX_FETCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+    
+    def get_transactions(self, start_date: str = None, end_date: str = None, category: str = None, transaction_type: str = None,
+                         limit: Optional[int] = _TX_PAGE_SIZE, offset: int = 0) -> List[Transaction]:
+        """Retrieve one page of transactions with optional filters (limit=None for all)"""
+        if not self.current_user:
+            print("Please log in first.")
+            return []
             
-            result = []
-            for trans in transactions:
-                result.append({
-                    'id': trans[0],
-                    'type': trans[1],
-                    'amount': trans[2],
-                    'category': trans[3],
-                    'description': trans[4],
-                    'date': trans[5]
-                })
-                
-            return result
+        try:
+            rows = self._iter_transactions(start_date, end_date, category, transaction_type, limit, offset)
+            return list(map(Transaction._make, rows))
         except Exception as e:
             print(f"Error retrieving transactions: {e}")
             return []
-        finally:
-            conn.close()
     
     def generate_report(self, period: str = "monthly") -> Dict:
         """Generate financial report for the specified period"""
@@ -281,28 +371,35 @@ class PersonalFinanceManager:
             
         now = datetime.datetime.now()
         
+        end_date = now.date().isoformat()
+        
         if period == "monthly":
-            start_date = now.replace(day=1).strftime("%Y-%m-%d")
-            end_date = now.strftime("%Y-%m-%d")
+            start_date = f"{now.year:04d}-{now.month:02d}-01"
         elif period == "yearly":
-            start_date = now.replace(month=1, day=1).strftime("%Y-%m-%d")
-            end_date = now.strftime("%Y-%m-%d")
+            start_date = f"{now.year:04d}-01-01"
         else:
             print("Invalid period. Use 'monthly' or 'yearly'.")
             return {}
             
-        transactions = self.get_transactions(start_date, end_date)
+        # Stored dates carry a time, so bound the period by the start of tomorrow
+        # to include today's transactions
+        end_bound = (now.date() + datetime.timedelta(days=1)).isoformat()
         
-        total_income = 0
-        total_expenses = 0
-        category_expenses = {}
+        # Let SQLite do the summing instead of walking every row in Python
+        params = (self.current_user, start_date, end_bound)
         
-        for trans in transactions:
-            if trans['type'] == 'income':
-                total_income += trans['amount']
-            else:
-                total_expenses += trans['amount']
-                category_expenses[trans['category']] = category_expenses.get(trans['category'], 0) + trans['amount']
+        try:
+            self.cursor.execute(_SQL_REPORT_TOTALS, params)
+            totals = dict(self.cursor.fetchall())
+            
+            self.cursor.execute(_SQL_REPORT_CATEGORIES, params)
+            category_expenses = dict(self.cursor.fetchall())
+        except Exception as e:
+            print(f"Error generating report: {e}")
+            return {}
+            
+        total_income = totals.get('income', 0)
+        total_expenses = totals.get('expense', 0)
         
         savings = total_income - total_expenses
         
@@ -331,20 +428,13 @@ class PersonalFinanceManager:
         year = now.year
         
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT OR REPLACE INTO budgets (user_id, category, amount, month, year) VALUES (?, ?, ?, ?, ?)",
-                (self.current_user, category, amount, month, year)
-            )
-            conn.commit()
-            print(f"Budget for {category} set to ${amount:.2f} for {now.strftime('%B %Y')}.")
+            with self.conn:
+                self.cursor.execute(_SQL_UPSERT_BUDGET, (self.current_user, category, amount, month, year))
+            print(f"Budget for {category} set to ${amount:.2f} for {now.strftime(_FMT_MONTH_YEAR)}.")
             return True
         except Exception as e:
             print(f"Error setting budget: {e}")
             return False
-        finally:
-            conn.close()
     
     def check_budget(self, category: str, amount: float) -> bool:
         """Check if a transaction exceeds the budget for its category"""
@@ -355,26 +445,20 @@ class PersonalFinanceManager:
         month = now.month
         year = now.year
         
+        # Budget and this month's spending for the category in one round-trip
+        start_date = f"{now.year:04d}-{now.month:02d}-01"
+        
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT amount FROM budgets WHERE user_id = ? AND category = ? AND month = ? AND year = ?",
-                (self.current_user, category, month, year)
+            self.cursor.execute(
+                _SQL_SELECT_BUDGET_STATUS,
+                (self.current_user, category, start_date, self.current_user, category, month, year)
             )
-            budget = cursor.fetchone()
+            budget = self.cursor.fetchone()
             
             if not budget:
                 return False
                 
-            budget_amount = budget[0]
-            
-            # Calculate total expenses for this category in the current month
-            start_date = now.replace(day=1).strftime("%Y-%m-%d")
-            end_date = now.strftime("%Y-%m-%d")
-            
-            expenses = self.get_transactions(start_date, end_date, category, 'expense')
-            total_spent = sum(trans['amount'] for trans in expenses)
+            budget_amount, total_spent = budget
             
             if total_spent > budget_amount:
                 print(f"Warning: You have exceeded your budget for {category}!")
@@ -384,8 +468,6 @@ class PersonalFinanceManager:
         except Exception as e:
             print(f"Error checking budget: {e}")
             return False
-        finally:
-            conn.close()
             
         return False
     
@@ -400,13 +482,8 @@ class PersonalFinanceManager:
         year = now.year
         
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT category, amount FROM budgets WHERE user_id = ? AND month = ? AND year = ?",
-                (self.current_user, month, year)
-            )
-            budgets = cursor.fetchall()
+            self.cursor.execute(_SQL_SELECT_BUDGETS, (self.current_user, month, year))
+            budgets = self.cursor.fetchall()
             
             result = []
             for budget in budgets:
@@ -419,18 +496,21 @@ class PersonalFinanceManager:
         except Exception as e:
             print(f"Error retrieving budgets: {e}")
             return []
-        finally:
-            conn.close()
     
-    def backup_data(self, backup_file: str) -> bool:
-        """Backup user data to a JSON file"""
+    def _rows_for_backup(self) -> Iterator[Dict]:
+        """Yield the current user's transactions as backup records"""
+        for trans in self._iter_transactions():
+            yield dict(zip(Transaction._fields, trans))
+    
+    def backup_data(self, backup_file: str, indent: Optional[int] = None) -> bool:
+        """Backup user data to a JSON file (compact unless indent is given)"""
         if not self.current_user:
             print("Please log in first.")
             return False
             
         try:
-            # Get transactions
-            transactions = self.get_transactions()
+            # Get transactions straight from the query, one record per row
+            transactions = list(self._rows_for_backup())
             
             # Get budgets
             budgets = self.get_budgets()
@@ -438,14 +518,18 @@ class PersonalFinanceManager:
             # Create backup data structure
             backup_data = {
                 'user_id': self.current_user,
-                'backup_date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'backup_date': _timestamp(datetime.datetime.now()),
                 'transactions': transactions,
                 'budgets': budgets
             }
             
             # Write to file
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=4)
+            if orjson is not None and indent is None:
+                with open(backup_file, 'wb') as f:
+                    f.write(orjson.dumps(backup_data))
+            else:
+                with open(backup_file, 'w') as f:
+                    json.dump(backup_data, f, indent=indent)
                 
             print(f"Backup created successfully: {backup_file}")
             return True
@@ -461,37 +545,38 @@ class PersonalFinanceManager:
             
         try:
             # Read backup file
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
+            with open(backup_file, 'rb') as f:
+                backup_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                 
             # Verify user ID matches
             if backup_data['user_id'] != self.current_user:
                 print("Backup file does not belong to the current user.")
                 return False
                 
-            # Clear existing data
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM transactions WHERE user_id = ?", (self.current_user,))
-            cursor.execute("DELETE FROM budgets WHERE user_id = ?", (self.current_user,))
-            
-            # Restore transactions
-            for trans in backup_data['transactions']:
-                cursor.execute(
-                    "INSERT INTO transactions (user_id, type, amount, category, description, date) VALUES (?, ?, ?, ?, ?, ?)",
-                    (self.current_user, trans['type'], trans['amount'], trans['category'], trans['description'], trans['date'])
-                )
+            with self.conn:
+                cursor = self.cursor
+                # Take the write lock up front so the deletes and inserts
+                # commit as one WAL transaction and cannot hit SQLITE_BUSY midway
+                cursor.execute("BEGIN IMMEDIATE")
                 
-            # Restore budgets
-            now = datetime.datetime.now()
-            for budget in backup_data['budgets']:
-                cursor.execute(
-                    "INSERT INTO budgets (user_id, category, amount, month, year) VALUES (?, ?, ?, ?, ?)",
-                    (self.current_user, budget['category'], budget['amount'], now.month, now.year)
-                )
+                # Clear existing data
+                cursor.execute(_SQL_DELETE_TX_BY_USER, (self.current_user,))
+                cursor.execute(_SQL_DELETE_BUDGETS_BY_USER, (self.current_user,))
                 
-            conn.commit()
-            conn.close()
+                # Restore transactions
+                cursor.executemany(
+                    _SQL_INSERT_TX,
+                    [(self.current_user, trans['type'], trans['amount'], trans['category'], trans['description'], trans['date'])
+                     for trans in backup_data['transactions']]
+                )
+                    
+                # Restore budgets
+                now = datetime.datetime.now()
+                cursor.executemany(
+                    _SQL_INSERT_BUDGET,
+                    [(self.current_user, budget['category'], budget['amount'], now.month, now.year)
+                     for budget in backup_data['budgets']]
+                )
             
             print("Data restored successfully!")
             return True
@@ -581,12 +666,28 @@ def main():
             else:
                 print("\nTransactions:")
                 print("-" * 80)
-                for trans in transactions:
-                    print(f"ID: {trans['id']} | {trans['date']} | {trans['type'].upper()} | "
-                          f"${trans['amount']:.2f} | {trans['category']} | {trans['description']}")
+                # Totals cover every page the user chose to view
+                total_income = 0
+                total_expense = 0
+                offset = 0
+                while True:
+                    for trans in transactions:
+                        print(f"ID: {trans.id} | {trans.date} | {trans.type.upper()} | "
+                              f"${trans.amount:.2f} | {trans.category} | {trans.description}")
+                        if trans.type == 'income':
+                            total_income += trans.amount
+                        else:
+                            total_expense += trans.amount
+                    offset += len(transactions)
+                    
+                    if len(transactions) < _TX_PAGE_SIZE:
+                        break
+                    if input("Show more? (y/n): ").strip().lower() != 'y':
+                        break
+                    transactions = manager.get_transactions(start_date, end_date, category, trans_type, offset=offset)
+                    if not transactions:
+                        break
                 print("-" * 80)
-                total_income = sum(t['amount'] for t in transactions if t['type'] == 'income')
-                total_expense = sum(t['amount'] for t in transactions if t['type'] == 'expense')
                 print(f"Total Income: ${total_income:.2f} | Total Expense: ${total_expense:.2f} | "
                       f"Net: ${(total_income - total_expense):.2f}")
                 
@@ -653,7 +754,7 @@ def main():
         elif choice == '11':
             backup_file = input("Enter backup filename: ").strip()
             if not backup_file:
-                backup_file = f"finance_backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                backup_file = f"finance_backup_{datetime.datetime.now().strftime(_FMT_BACKUP_STAMP)}.json"
             manager.backup_data(backup_file)
             
         elif choice == '12':
@@ -665,6 +766,7 @@ def main():
                 
         elif choice == '13':
             print("Thank you for using Personal Finance Manager!")
+            manager.close()
             break
             
         else: